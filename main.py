@@ -1,13 +1,88 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import sys
 import json
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from weather_providers.factory import WeatherProviderFactory
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON, using orjson's C parser when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Static message skeletons live at module scope so each run only pays for
+# the value interpolation, not rebuilding the template
+_MORNING_TEMPLATE = """🌅 *Good Morning! Today's Weather Forecast*
+📍 *{city}* - {today_date} ({timezone_name})
+
+🌡️ **Temperature Forecast:**
+   📈 Max: `{forecasted_max}°C`
+   📉 Min: `{forecasted_min}°C`
+   🌡️ Current: `{current_temp}°C`
+
+☁️ **Conditions:** `{description}`"""
+
+_EVENING_TEMPLATE = """🌆 *Evening Weather Summary*
+📍 *{city}* - {today_date} ({timezone_name})
+
+🌡️ **Today's Actual Temperatures:**
+   📈 Max: `{actual_max}°C`
+   📉 Min: `{actual_min}°C`
+   🌡️ Current: `{current_temp}°C`
+
+☁️ **Current Conditions:** `{description}`
+
+📊 **Data Summary:**
+   📋 Total readings: {total_readings}
+   ⏰ First reading: {first_reading}
+   ⏰ Last reading: {last_reading}
+
+Sleep well! 😴"""
+
+_EVENING_OPEN_METEO_TEMPLATE = """🌆 *Evening Weather Summary*
+📍 *{city}* - {today_date} ({timezone_name})
+
+🌡️ **Today's Temperatures:**
+   📈 Max: `{today_max}°C`
+   📉 Min: `{today_min}°C`
+   🌡️ Current: `{current_temp}°C`
+
+☁️ **Current Conditions:** `{current_description}`
+
+🔮 **Tomorrow Forecast:**
+   📈 Max: `{tomorrow_max}°C`
+   📉 Min: `{tomorrow_min}°C`
+   ☁️ Conditions: `{tomorrow_description}`
+
+Sleep well! 😴"""
+
 
 class WeatherTelegramBot:
+    _geocode_cache_path = "geocode_cache.json"
+    _geocode_cache_ttl = 30 * 86400  # 30 days; city coordinates rarely change
+    _temp_storage_path = "temp_readings.jsonl"
+    _temp_storage_compact_bytes = 100 * 1024
+
     def __init__(self):
         self.openweather_api_key = os.environ.get("OPENWEATHER_API_KEY")
         self.telegram_bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
@@ -21,14 +96,14 @@ class WeatherTelegramBot:
             "WEATHER_PROVIDER", "openweathermap"
         ).lower()
 
-        # Initialize timezone
+        # Initialize timezone (zoneinfo is stdlib, C-backed, and caches keys)
         try:
-            self.timezone = pytz.timezone(self.user_timezone)
-        except pytz.UnknownTimeZoneError:
+            self.timezone = ZoneInfo(self.user_timezone)
+        except (ZoneInfoNotFoundError, ValueError):
             print(
                 f"Warning: Unknown timezone '{self.user_timezone}', using UTC instead"
             )
-            self.timezone = pytz.UTC
+            self.timezone = timezone.utc
             self.user_timezone = "UTC"
 
         # Validate required environment variables based on provider
@@ -55,10 +130,52 @@ class WeatherTelegramBot:
         except ValueError as e:
             raise ValueError(f"Weather provider error: {e}")
 
+        # In-memory geocode cache so repeat lookups within one run hit a dict
+        self._geo_cache = None
+
+        # Parsed morning_forecast.json, loaded at most once per run
+        self._forecast_cache = None
+
+        # Per-run snapshot of the user-local time; computed lazily so every
+        # caller sees one consistent "now" (no midnight-straddling skew).
+        # The derived date strings are cached with it since strftime is slow
+        self._user_time = None
+        self._today_str = None
+        self._today_date = None
+
+        # Shared HTTP session: keep-alive avoids a fresh TCP+TLS handshake
+        # per call, and the adapter retries transient server errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                # 429 is handled in send_telegram_message, which can honor
+                # the retry_after value Telegram puts in the response body
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        )
+
+        # Small worker pool for overlapping independent I/O (disk vs network)
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._coords_future = None
+
     def get_user_current_time(self):
-        """Get current time in user's timezone"""
-        utc_now = datetime.now(pytz.UTC)
-        return utc_now.astimezone(self.timezone)
+        """Get current time in user's timezone (computed once per run)"""
+        if self._user_time is None:
+            # datetime.now accepts the target tzinfo directly; no need to
+            # build a UTC datetime first and convert it
+            self._user_time = datetime.now(self.timezone)
+            self._today_str = self._user_time.strftime("%Y-%m-%d")
+            self._today_date = self._user_time.strftime("%B %d, %Y")
+        return self._user_time
 
     def determine_report_type(self):
         """Determine if it should be morning or evening report based on user's current time"""
@@ -76,9 +193,46 @@ class WeatherTelegramBot:
         else:
             return "morning"
 
+    def _read_state_file(self, path):
+        """Read one JSON state file in a single open, empty dict when missing"""
+        try:
+            with open(path, "rb") as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Could not read {path}: {e}")
+        return {}
+
+    def _write_state_file(self, path, data):
+        """Write one JSON state file in a single open; failures are non-fatal"""
+        try:
+            with open(path, "wb") as f:
+                f.write(_json_dumps(data))
+        except (OSError, TypeError) as e:
+            print(f"Could not save {path}: {e}")
+
     def get_coordinates(self):
-        """Get city coordinates using the configured weather provider"""
-        return self.weather_provider.get_coordinates(self.city)
+        """Get city coordinates, using a cached result when available"""
+        key = self.city.strip().lower()
+
+        if self._geo_cache is None:
+            self._geo_cache = self._read_state_file(self._geocode_cache_path)
+
+        entry = self._geo_cache.get(key)
+        if entry and entry.get("ts", 0) > time.time() - self._geocode_cache_ttl:
+            return entry["lat"], entry["lon"]
+
+        lat, lon = self.weather_provider.get_coordinates(self.city)
+        self._geo_cache[key] = {"lat": lat, "lon": lon, "ts": time.time()}
+        self._write_state_file(self._geocode_cache_path, self._geo_cache)
+        return lat, lon
+
+    def _get_coordinates_prefetched(self):
+        """Coordinates from the background prefetch started in run(), if any"""
+        if self._coords_future is not None:
+            return self._coords_future.result()
+        return self.get_coordinates()
 
     def get_today_forecast(self, lat, lon):
         """Get today's forecast using the configured weather provider"""
@@ -86,40 +240,46 @@ class WeatherTelegramBot:
 
     def get_today_actual_temps(self):
         """Get actual temperatures recorded today (evening report)"""
-        # Read stored temperature data from throughout the day
-        temp_data = self.read_temp_storage()
+        user_time = self.get_user_current_time()
 
-        # Get current temperature and add to our records
-        lat, lon = self.get_coordinates()
+        # Stored readings come from disk and the current temperature from the
+        # network; neither depends on the other, so overlap them
+        temp_future = self._executor.submit(self.read_temp_storage)
+        lat, lon = self._get_coordinates_prefetched()
         current_data = self.weather_provider.get_current_weather(lat, lon)
+        temp_data = temp_future.result()
 
         current_temp = round(current_data["temp"], 1)
-        user_time = self.get_user_current_time()
         current_time = user_time.strftime("%H:%M")
 
-        # Add current reading to our data
-        today_str = user_time.strftime("%Y-%m-%d")
-        if today_str not in temp_data:
-            temp_data[today_str] = []
+        # Add current reading to our data; setdefault both creates the
+        # day bucket when missing and hands back the list in one lookup
+        today_str = self._today_str
+        today_readings = temp_data.setdefault(today_str, [])
 
-        temp_data[today_str].append(
-            {
-                "time": current_time,
-                "temp": current_temp,
-                "description": current_data["description"],
-            }
-        )
+        reading = {
+            "time": current_time,
+            "temp": current_temp,
+            "description": current_data["description"],
+        }
+        today_readings.append(reading)
 
-        # Save updated data
-        self.save_temp_storage(temp_data)
+        # Persist just the new reading
+        self.save_temp_storage(today_str, reading)
 
         # Calculate actual max/min from today's readings
-        today_readings = temp_data.get(today_str, [])
         if today_readings:
-            temps = [reading["temp"] for reading in today_readings]
+            # One pass for both extremes, no intermediate temps list
+            max_temp = min_temp = today_readings[0]["temp"]
+            for reading in today_readings[1:]:
+                temp = reading["temp"]
+                if temp > max_temp:
+                    max_temp = temp
+                elif temp < min_temp:
+                    min_temp = temp
             return {
-                "actual_max": round(max(temps), 1),
-                "actual_min": round(min(temps), 1),
+                "actual_max": round(max_temp, 1),
+                "actual_min": round(min_temp, 1),
                 "current_temp": current_temp,
                 "total_readings": len(today_readings),
                 "first_reading": today_readings[0]["time"],
@@ -138,34 +298,87 @@ class WeatherTelegramBot:
             }
 
     def read_temp_storage(self):
-        """Read temperature storage file"""
-        try:
-            if os.path.exists("temp_readings.json"):
-                with open("temp_readings.json", "r") as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        return {}
-
-    def save_temp_storage(self, data):
-        """Save temperature data to storage file"""
+        """Read temperature readings grouped by date, dropping entries older than 7 days"""
+        user_time = self.get_user_current_time()
+        cutoff_date = (user_time - timedelta(days=7)).strftime("%Y-%m-%d")
+        data = {}
         try:
-            # Keep only last 7 days of data to avoid file getting too large
-            user_time = self.get_user_current_time()
-            cutoff_date = (user_time - timedelta(days=7)).strftime("%Y-%m-%d")
-            filtered_data = {
-                date: readings for date, readings in data.items() if date >= cutoff_date
+            with open(self._temp_storage_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    reading = _json_loads(line)
+                    date = reading.get("date")
+                    if not date or date < cutoff_date:
+                        continue
+                    data.setdefault(date, []).append(
+                        {
+                            "time": reading["time"],
+                            "temp": reading["temp"],
+                            "description": reading.get("description", ""),
+                        }
+                    )
+        except FileNotFoundError:
+            # Legacy single-document format from before the append-only log
+            legacy = self._read_state_file("temp_readings.json")
+            data = {
+                date: readings
+                for date, readings in legacy.items()
+                if date >= cutoff_date
             }
-
-            with open("temp_readings.json", "w") as f:
-                json.dump(filtered_data, f, indent=2)
-        except Exception as e:
+            # Seed the log with the kept history so later runs (which only
+            # ever append to and read the log) don't lose it
+            self._migrate_legacy_readings(data)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not read temperature data: {e}")
+        return data
+
+    def _migrate_legacy_readings(self, data):
+        """One-time copy of the kept legacy readings into the append-only log"""
+        try:
+            with open(self._temp_storage_path, "xb") as f:
+                for date, readings in data.items():
+                    for reading in readings:
+                        f.write(_json_dumps({"date": date, **reading}) + b"\n")
+        except FileExistsError:
+            pass  # log appeared in the meantime; don't clobber it
+        except (OSError, TypeError) as e:
+            print(f"Could not migrate legacy temperature data: {e}")
+
+    def save_temp_storage(self, today_str, reading):
+        """Append one reading to the storage log (O(1) instead of a full rewrite)"""
+        try:
+            with open(self._temp_storage_path, "ab") as f:
+                f.write(_json_dumps({"date": today_str, **reading}) + b"\n")
+            self._compact_temp_storage()
+        except (OSError, TypeError) as e:
             print(f"Could not save temperature data: {e}")
 
+    def _compact_temp_storage(self):
+        """Rewrite the log without stale entries once it grows past the threshold"""
+        try:
+            size = os.path.getsize(self._temp_storage_path)
+            if size <= self._temp_storage_compact_bytes:
+                return
+            kept = self.read_temp_storage()
+            payload = b"".join(
+                _json_dumps({"date": date, **reading}) + b"\n"
+                for date, readings in kept.items()
+                for reading in readings
+            )
+            if len(payload) >= size:
+                # Nothing was evicted; rewriting would churn identical bytes
+                return
+            with open(self._temp_storage_path, "wb") as f:
+                f.write(payload)
+        except OSError as e:
+            print(f"Could not compact temperature log: {e}")
+
     def create_morning_message(self, forecast_data):
         """Create morning forecast message"""
         user_time = self.get_user_current_time()
-        today_date = user_time.strftime("%B %d, %Y")
+        today_date = self._today_date
         timezone_name = self.user_timezone
         # Build a list of forecasts at 3-hour intervals, max 4 entries, converted to user timezone
         selected_forecasts = []
@@ -176,7 +389,7 @@ class WeatherTelegramBot:
                 detailed = sorted(detailed, key=lambda f: f["timestamp"])
                 last_added_hour = None
                 for f in detailed:
-                    utc_dt = datetime.fromtimestamp(f["timestamp"], tz=pytz.UTC)
+                    utc_dt = datetime.fromtimestamp(f["timestamp"], tz=timezone.utc)
                     local_dt = utc_dt.astimezone(self.timezone)
                     # Only include forecasts for today (user's local date)
                     if local_dt.date() != user_time.date():
@@ -207,133 +420,134 @@ class WeatherTelegramBot:
                     if len(selected_forecasts) == 4:
                         break
 
-        message_lines = [
-            "🌅 *Good Morning! Today's Weather Forecast*",
-            f"📍 *{self.city}* - {today_date} ({timezone_name})",
-            "",
-            "🌡️ **Temperature Forecast:**",
-            f"   📈 Max: `{forecast_data['forecasted_max']}°C`",
-            f"   📉 Min: `{forecast_data['forecasted_min']}°C`",
-            f"   🌡️ Current: `{forecast_data['current_temp']}°C`",
-            "",
-            f"☁️ **Conditions:** `{forecast_data['description'].title()}`",
+        message_parts = [
+            _MORNING_TEMPLATE.format(
+                city=self.city,
+                today_date=today_date,
+                timezone_name=timezone_name,
+                forecasted_max=forecast_data["forecasted_max"],
+                forecasted_min=forecast_data["forecasted_min"],
+                current_temp=forecast_data["current_temp"],
+                description=forecast_data["description"].title(),
+            )
         ]
 
         if selected_forecasts:
-            message_lines.append("")
-            message_lines.append("⏰ **3-Hour Interval Forecast:**")
-            for f in selected_forecasts:
-                message_lines.append(
-                    f"   `{f['time']}` - {f['temp']}°C ({f['description']})"
-                )
+            message_parts.append("")
+            message_parts.append("⏰ **3-Hour Interval Forecast:**")
+            message_parts.extend(
+                f"   `{f['time']}` - {f['temp']}°C ({f['description']})"
+                for f in selected_forecasts
+            )
 
-        message_lines.append("")
-        message_lines.append("Have a great day! 🌟")
-        return "\n".join(message_lines)
+        message_parts.append("")
+        message_parts.append("Have a great day! 🌟")
+        return "\n".join(message_parts)
 
     def create_evening_message(self, actual_data):
         """Create evening actual temperature report"""
-        user_time = self.get_user_current_time()
-        today_date = user_time.strftime("%B %d, %Y")
+        self.get_user_current_time()
+        today_date = self._today_date
         timezone_name = self.user_timezone
 
-        message = f"""🌆 *Evening Weather Summary*
-📍 *{self.city}* - {today_date} ({timezone_name})
-
-🌡️ **Today's Actual Temperatures:**
-   📈 Max: `{actual_data["actual_max"]}°C`
-   📉 Min: `{actual_data["actual_min"]}°C`
-   🌡️ Current: `{actual_data["current_temp"]}°C`
-
-☁️ **Current Conditions:** `{actual_data["description"].title()}`
-
-📊 **Data Summary:**
-   📋 Total readings: {actual_data["total_readings"]}
-   ⏰ First reading: {actual_data["first_reading"]}
-   ⏰ Last reading: {actual_data["last_reading"]}
-
-Sleep well! 😴"""
-        return message
+        return _EVENING_TEMPLATE.format(
+            city=self.city,
+            today_date=today_date,
+            timezone_name=timezone_name,
+            actual_max=actual_data["actual_max"],
+            actual_min=actual_data["actual_min"],
+            current_temp=actual_data["current_temp"],
+            description=actual_data["description"].title(),
+            total_readings=actual_data["total_readings"],
+            first_reading=actual_data["first_reading"],
+            last_reading=actual_data["last_reading"],
+        )
 
     def create_evening_message_open_meteo(self, summary):
         """Create simplified evening message for Open-Meteo with today's actuals and tomorrow forecast."""
-        user_time = self.get_user_current_time()
-        today_date = user_time.strftime("%B %d, %Y")
+        self.get_user_current_time()
+        today_date = self._today_date
         timezone_name = self.user_timezone
 
-        message = f"""🌆 *Evening Weather Summary*
-📍 *{self.city}* - {today_date} ({timezone_name})
-
-🌡️ **Today's Temperatures:**
-   📈 Max: `{summary["today_max"]}°C`
-   📉 Min: `{summary["today_min"]}°C`
-   🌡️ Current: `{summary["current_temp"]}°C`
-
-☁️ **Current Conditions:** `{summary["current_description"].title()}`
-
-🔮 **Tomorrow Forecast:**
-   📈 Max: `{summary["tomorrow_max"]}°C`
-   📉 Min: `{summary["tomorrow_min"]}°C`
-   ☁️ Conditions: `{summary["tomorrow_description"].title()}`
-
-Sleep well! 😴"""
-        return message
+        return _EVENING_OPEN_METEO_TEMPLATE.format(
+            city=self.city,
+            today_date=today_date,
+            timezone_name=timezone_name,
+            today_max=summary["today_max"],
+            today_min=summary["today_min"],
+            current_temp=summary["current_temp"],
+            current_description=summary["current_description"].title(),
+            tomorrow_max=summary["tomorrow_max"],
+            tomorrow_min=summary["tomorrow_min"],
+            tomorrow_description=summary["tomorrow_description"].title(),
+        )
 
     def get_comparison_message(self, actual_data):
         """Get comparison with morning forecast if available"""
         try:
-            if os.path.exists("morning_forecast.json"):
-                with open("morning_forecast.json", "r") as f:
-                    forecast_data = json.load(f)
-
-                user_time = self.get_user_current_time()
-                today_str = user_time.strftime("%Y-%m-%d")
-                if today_str in forecast_data:
-                    morning_forecast = forecast_data[today_str]
-
-                    max_diff = (
-                        actual_data["actual_max"] - morning_forecast["forecasted_max"]
-                    )
-                    min_diff = (
-                        actual_data["actual_min"] - morning_forecast["forecasted_min"]
-                    )
-
-                    comparison = "\n\n📊 **Forecast vs Actual:**"
-                    comparison += f"\n   Max: Predicted `{morning_forecast['forecasted_max']}°C`, Actual `{actual_data['actual_max']}°C` "
-                    comparison += (
-                        f"({'📈+' if max_diff > 0 else '📉'}{max_diff:+.1f}°C)"
-                    )
-                    comparison += f"\n   Min: Predicted `{morning_forecast['forecasted_min']}°C`, Actual `{actual_data['actual_min']}°C` "
-                    comparison += (
-                        f"({'📈+' if min_diff > 0 else '📉'}{min_diff:+.1f}°C)"
-                    )
+            if self._forecast_cache is None:
+                self._forecast_cache = self._read_state_file("morning_forecast.json")
+
+            self.get_user_current_time()
+            morning_forecast = self._forecast_cache.get(self._today_str)
+            if morning_forecast:
+                max_diff = (
+                    actual_data["actual_max"] - morning_forecast["forecasted_max"]
+                )
+                min_diff = (
+                    actual_data["actual_min"] - morning_forecast["forecasted_min"]
+                )
 
-                    return comparison
-        except Exception:
+                return "".join(
+                    [
+                        "\n\n📊 **Forecast vs Actual:**",
+                        f"\n   Max: Predicted `{morning_forecast['forecasted_max']}°C`, Actual `{actual_data['actual_max']}°C` ",
+                        f"({'📈+' if max_diff > 0 else '📉'}{max_diff:+.1f}°C)",
+                        f"\n   Min: Predicted `{morning_forecast['forecasted_min']}°C`, Actual `{actual_data['actual_min']}°C` ",
+                        f"({'📈+' if min_diff > 0 else '📉'}{min_diff:+.1f}°C)",
+                    ]
+                )
+        except (KeyError, TypeError):
             pass
         return ""
 
     def save_morning_forecast(self, forecast_data):
         """Save morning forecast for evening comparison"""
         try:
-            data = {}
-            if os.path.exists("morning_forecast.json"):
-                with open("morning_forecast.json", "r") as f:
-                    data = json.load(f)
-
             user_time = self.get_user_current_time()
-            today_str = user_time.strftime("%Y-%m-%d")
-            data[today_str] = forecast_data
-
-            # Keep only last 7 days
+            today_str = self._today_str
             cutoff_date = (user_time - timedelta(days=7)).strftime("%Y-%m-%d")
-            data = {
-                date: forecast for date, forecast in data.items() if date >= cutoff_date
-            }
 
-            with open("morning_forecast.json", "w") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
+            # One open for the whole read/modify/write cycle instead of a
+            # separate read and write pass
+            try:
+                f = open("morning_forecast.json", "r+b")
+            except FileNotFoundError:
+                f = open("morning_forecast.json", "w+b")
+            with f:
+                raw = f.read()
+                try:
+                    data = _json_loads(raw) if raw else {}
+                except ValueError:
+                    data = {}
+
+                # Drop stale days in place and skip the rewrite entirely when
+                # a re-run would store exactly what is already on disk
+                stale = [date for date in data if date < cutoff_date]
+                if not stale and data.get(today_str) == forecast_data:
+                    self._forecast_cache = data
+                    return
+                for date in stale:
+                    del data[date]
+                data[today_str] = forecast_data
+
+                f.seek(0)
+                f.truncate()
+                f.write(_json_dumps(data))
+
+            # Keep the in-memory copy current for get_comparison_message
+            self._forecast_cache = data
+        except (OSError, TypeError) as e:
             print(f"Could not save forecast data: {e}")
 
     def send_telegram_message(self, message):
@@ -346,24 +560,44 @@ Sleep well! 😴"""
             "parse_mode": "Markdown",
         }
 
-        response = requests.post(url, json=payload)
+        # Serialize once with the fast dumps helper instead of letting
+        # requests re-encode the payload on every retry
+        body = _json_dumps(payload)
+        headers = {"Content-Type": "application/json"}
+
+        # Telegram rate-limits at roughly 1 msg/s; on 429 it reports how long
+        # to wait in the response body, so honor that instead of losing the
+        # message and re-running the whole pipeline on the next cron slot
+        for attempt in range(3):
+            response = self.session.post(url, data=body, headers=headers)
+            if response.status_code == 429:
+                try:
+                    retry_after = response.json()["parameters"]["retry_after"]
+                except (ValueError, KeyError):
+                    retry_after = 2**attempt
+                print(f"Telegram rate limit hit, retrying in {retry_after}s...")
+                time.sleep(retry_after)
+                continue
+            break
         response.raise_for_status()
 
         print("Weather report sent to Telegram successfully!")
-        return response.json()
 
     def run_morning_report(self):
         """Run morning forecast report"""
         try:
             print("Getting city coordinates...")
-            lat, lon = self.get_coordinates()
+            lat, lon = self._get_coordinates_prefetched()
             print(f"Coordinates for {self.city}: {lat}, {lon}")
 
             print("Getting today's forecast...")
             forecast_data = self.get_today_forecast(lat, lon)
 
             print("Saving forecast for evening comparison...")
-            self.save_morning_forecast(forecast_data)
+            # Disk write is independent of the Telegram send; overlap them
+            save_future = self._executor.submit(
+                self.save_morning_forecast, forecast_data
+            )
 
             print("Creating morning message...")
             message = self.create_morning_message(forecast_data)
@@ -371,6 +605,7 @@ Sleep well! 😴"""
             print("Sending morning report to Telegram...")
             self.send_telegram_message(message)
 
+            save_future.result()
             print("✅ Morning weather report completed successfully!")
 
         except Exception as e:
@@ -386,7 +621,7 @@ Sleep well! 😴"""
         try:
             if self.weather_provider_name == "open_meteo":
                 print("Getting Open-Meteo daily summary...")
-                lat, lon = self.get_coordinates()
+                lat, lon = self._get_coordinates_prefetched()
                 summary = self.weather_provider.get_daily_summary(lat, lon)
                 print("Creating simplified Open-Meteo evening message...")
                 message = self.create_evening_message_open_meteo(summary)
@@ -420,6 +655,10 @@ Sleep well! 😴"""
         print(f"Report type setting: {self.report_type}")
         print(f"Determined report type: {actual_report_type}")
 
+        # Both report types need coordinates first; start the lookup now so
+        # it overlaps the remaining setup (usually a cache hit anyway)
+        self._coords_future = self._executor.submit(self.get_coordinates)
+
         if actual_report_type == "evening":
             self.run_evening_report()
         else:
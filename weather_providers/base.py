@@ -1,13 +1,101 @@
+import json
+
 from abc import ABC, abstractmethod
 from typing import Dict, List, Tuple, Any
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works fine without it
+    orjson = None
+
+# Only advertise brotli when urllib3 can actually decode it; forecast
+# JSON compresses noticeably better under br than gzip
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Bound every provider request: (connect, read) seconds
+_REQUEST_TIMEOUT = (3, 10)
+
+# One pooled session shared by every provider instance, so a fallback
+# chain of providers still reuses the same connections and DNS lookups
+_shared_session = None
+
+
+def _get_session() -> requests.Session:
+    """Return the lazily-built session shared across all providers.
+
+    Keep-alive session with a small pool: provider methods hit the same
+    API host several times per run, so reusing the connection skips
+    repeat TCP+TLS handshakes; transient 429/5xx are retried.
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": _ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
+        _shared_session = session
+    return _shared_session
+
 
 class WeatherProvider(ABC):
     """Abstract base class for weather providers."""
-    
+
     def __init__(self, api_key: str = None):
         self.api_key = api_key
-    
+        self._session = _get_session()
+
+    def _get_json(self, url: str, params: Dict[str, Any] = None) -> Any:
+        """GET a JSON endpoint on the pooled session and return the parsed body.
+
+        Centralizes the get + raise_for_status + parse sequence that every
+        provider method repeats, so they all share the same connection pool
+        and error behaviour.
+        """
+        response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        # Parse the raw bytes directly; response.json() would first
+        # materialize response.text
+        return _loads(response.content)
+
     @abstractmethod
     def get_coordinates(self, city: str) -> Tuple[float, float]:
         """Get city coordinates (latitude, longitude)."""
@@ -1,41 +1,43 @@
-from typing import Dict, Type
+import importlib
+from typing import Dict, Tuple
 from .base import WeatherProvider
-from .openweathermap import OpenWeatherMapProvider
-from .open_meteo import OpenMeteoProvider
 
 
 class WeatherProviderFactory:
     """Factory class for creating weather provider instances."""
-    
-    _providers: Dict[str, Type[WeatherProvider]] = {
-        'openweathermap': OpenWeatherMapProvider,
-        'open_meteo': OpenMeteoProvider,
+
+    # Providers are referenced by module/class name and imported on demand,
+    # so a run only pays the import cost of the provider it actually uses
+    _providers: Dict[str, Tuple[str, str]] = {
+        'openweathermap': ('weather_providers.openweathermap', 'OpenWeatherMapProvider'),
+        'open_meteo': ('weather_providers.open_meteo', 'OpenMeteoProvider'),
     }
-    
+
     @classmethod
     def create_provider(cls, provider_name: str, api_key: str = None) -> WeatherProvider:
         """Create a weather provider instance.
-        
+
         Args:
             provider_name: Name of the provider ('openweathermap' or 'open_meteo')
             api_key: API key (required for some providers like OpenWeatherMap)
-            
+
         Returns:
             WeatherProvider instance
-            
+
         Raises:
             ValueError: If provider name is not supported
         """
         provider_name = provider_name.lower()
-        
+
         if provider_name not in cls._providers:
             available = ', '.join(cls._providers.keys())
             raise ValueError(f"Unsupported weather provider '{provider_name}'. Available providers: {available}")
-        
-        provider_class = cls._providers[provider_name]
+
+        module_name, class_name = cls._providers[provider_name]
+        provider_class = getattr(importlib.import_module(module_name), class_name)
         return provider_class(api_key)
-    
+
     @classmethod
     def get_available_providers(cls) -> list:
         """Get list of available provider names."""
-        return list(cls._providers.keys())
\ No newline at end of file
+        return list(cls._providers.keys())
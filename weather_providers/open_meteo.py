@@ -1,51 +1,119 @@
-import requests
-from datetime import datetime, date, timedelta, timezone
-from typing import Dict, Tuple, Any
+import time
+
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any
 from .base import WeatherProvider
 
 
+# WMO weather interpretation codes; built once at import instead of per call
+_WMO_DESCRIPTIONS = {
+    0: "clear sky",
+    1: "mainly clear",
+    2: "partly cloudy",
+    3: "overcast",
+    45: "fog",
+    48: "depositing rime fog",
+    51: "light drizzle",
+    53: "moderate drizzle",
+    55: "dense drizzle",
+    56: "light freezing drizzle",
+    57: "dense freezing drizzle",
+    61: "slight rain",
+    63: "moderate rain",
+    65: "heavy rain",
+    66: "light freezing rain",
+    67: "heavy freezing rain",
+    71: "slight snow fall",
+    73: "moderate snow fall",
+    75: "heavy snow fall",
+    77: "snow grains",
+    80: "slight rain showers",
+    81: "moderate rain showers",
+    82: "violent rain showers",
+    85: "slight snow showers",
+    86: "heavy snow showers",
+    95: "thunderstorm",
+    96: "thunderstorm with slight hail",
+    99: "thunderstorm with heavy hail",
+}
+
+# Flat lookup table over the full 0-99 code range ("" for unassigned
+# codes): plain indexing beats a dict probe in the per-hour hot path
+_WMO_DESC_TABLE = tuple(_WMO_DESCRIPTIONS.get(code, "") for code in range(100))
+
+
 class OpenMeteoProvider(WeatherProvider):
     """Open-Meteo weather provider implementation (free, no API key required)."""
 
+    # How long one combined forecast response may serve repeat calls;
+    # Open-Meteo refreshes current conditions far less often than this
+    _combined_ttl = 60
+
     def __init__(self, api_key: str = None):
         super().__init__(api_key)
         # Open-Meteo doesn't require an API key
+        # Coordinates never change for a city, so memoize lookups in-process
+        self._coords_cache = {}
+        # Combined forecast responses keyed by rounded (lat, lon),
+        # as key -> (fetched_at, data)
+        self._combined_cache = {}
+
+    def _fetch_combined(self, lat: float, lon: float) -> Dict[str, Any]:
+        """Fetch current + hourly + daily data in a single endpoint call.
+
+        The forecast endpoint accepts all three sections at once, so callers
+        that need more than one of them within a run share one HTTP round
+        trip and one parsed response. Two forecast days are requested so
+        the daily summary's tomorrow block comes from the same response.
+        """
+        key = (round(lat, 3), round(lon, 3))
+        cached = self._combined_cache.get(key)
+        if cached is not None:
+            fetched_at, data = cached
+            if time.time() - fetched_at < self._combined_ttl:
+                return data
+
+        url = "https://api.open-meteo.com/v1/forecast"
+        params = {
+            "latitude": lat,
+            "longitude": lon,
+            "current": "temperature_2m,weather_code",
+            "hourly": "temperature_2m,weather_code",
+            "daily": "temperature_2m_max,temperature_2m_min,weather_code",
+            "timezone": "auto",  # location local time
+            "timeformat": "unixtime",  # easier for downstream timezone conversion
+            "forecast_days": 2,  # today + tomorrow
+        }
+
+        data = self._get_json(url, params)
+
+        self._combined_cache[key] = (time.time(), data)
+        return data
 
     def get_coordinates(self, city: str) -> Tuple[float, float]:
         """Get city coordinates using Open-Meteo geocoding API."""
+        key = city.strip().lower()
+        cached = self._coords_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Use OpenStreetMap Nominatim API (used by Open-Meteo)
         geo_url = "https://geocoding-api.open-meteo.com/v1/search"
         params = {"name": city, "count": 1}
 
-        response = requests.get(geo_url, params=params)
-        response.raise_for_status()
-
-        data = response.json()
+        data = self._get_json(geo_url, params)
         if not data.get("results"):
             raise Exception(f"City '{city}' not found")
 
         result = data["results"][0]
-        return result["latitude"], result["longitude"]
+        coords = (result["latitude"], result["longitude"])
+        self._coords_cache[key] = coords
+        return coords
 
     def get_today_forecast(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get today's forecast using Open-Meteo forecast API."""
-        url = "https://api.open-meteo.com/v1/forecast"
-        today_str = date.today().isoformat()
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "hourly": "temperature_2m,weather_code",
-            "daily": "temperature_2m_max,temperature_2m_min",
-            "timezone": "auto",  # location local time
-            "timeformat": "unixtime",  # easier for downstream timezone conversion
-            "start_date": today_str,
-            "end_date": today_str,
-        }
-
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = self._fetch_combined(lat, lon)
 
         # Extract utc offset (seconds) for location local time
         offset_seconds = data.get("utc_offset_seconds", 0)
@@ -54,44 +122,56 @@ class OpenMeteoProvider(WeatherProvider):
         hourly_temps = data["hourly"]["temperature_2m"]
         hourly_codes = data["hourly"]["weather_code"]
 
-        # Current times
-        now_utc = datetime.now(timezone.utc)
-        location_now_local = now_utc + timedelta(seconds=offset_seconds)
-        location_today = location_now_local.date()
-
-        detailed_forecast = []
-        future_temps = []
-
-        for i, ts in enumerate(hourly_times):
-            # ts is unix epoch seconds in UTC
-            forecast_dt_utc = datetime.fromtimestamp(ts, tz=timezone.utc)
-            forecast_dt_local = forecast_dt_utc + timedelta(seconds=offset_seconds)
-            if (
-                forecast_dt_local.date() == location_today
-                and forecast_dt_utc >= now_utc
-            ):
-                future_temps.append(hourly_temps[i])
-                detailed_forecast.append(
-                    {
-                        "temp": round(hourly_temps[i], 1),
-                        "timestamp": int(ts),  # UTC epoch seconds
-                        "description": self._weather_code_to_description(
-                            hourly_codes[i]
-                        ),
-                    }
-                )
+        # Keep hourly entries that are today (location-local) and not in the
+        # past: with unixtime timestamps that is a pure integer window check,
+        # no per-entry datetime construction needed
+        now_ts = int(time.time())
+        local_day_end = (
+            (now_ts + offset_seconds) // 86400 * 86400 + 86400 - offset_seconds
+        )
+
+        # hourly arrays are sorted by time, so locate the window boundaries
+        # with bisect and slice instead of scanning every entry
+        start = bisect_left(hourly_times, now_ts)
+        end = bisect_left(hourly_times, local_day_end, start)
+
+        future_temps = hourly_temps[start:end]
+        detailed_forecast = [
+            {
+                "temp": round(temp, 1),
+                "timestamp": int(ts),  # UTC epoch seconds
+                "description": self._weather_code_to_description(code),
+            }
+            for ts, temp, code in zip(
+                hourly_times[start:end],
+                future_temps,
+                hourly_codes[start:end],
+            )
+        ]
 
         # Get daily min/max
         daily_max = data["daily"]["temperature_2m_max"][0]
         daily_min = data["daily"]["temperature_2m_min"][0]
 
-        # Current temperature (use first future forecast or fallback to first hourly entry)
-        current_temp = future_temps[0] if future_temps else hourly_temps[0]
+        # Current temperature: prefer the real current block from the combined
+        # response, falling back to the nearest hourly entry
+        current_block = data.get("current")
+        if current_block:
+            current_temp = current_block["temperature_2m"]
+        else:
+            current_temp = future_temps[0] if future_temps else hourly_temps[0]
 
-        # Use actual forecasted max/min or calculated from remaining temps
+        # Use actual forecasted max/min or calculated from remaining temps;
+        # one pass over the remaining hours finds both extremes
         if future_temps:
-            forecasted_max = max(max(future_temps), daily_max)
-            forecasted_min = min(min(future_temps), daily_min)
+            fmax = fmin = future_temps[0]
+            for temp in future_temps[1:]:
+                if temp > fmax:
+                    fmax = temp
+                elif temp < fmin:
+                    fmin = temp
+            forecasted_max = fmax if fmax > daily_max else daily_max
+            forecasted_min = fmin if fmin < daily_min else daily_min
         else:
             forecasted_max = daily_max
             forecasted_min = daily_min
@@ -107,24 +187,8 @@ class OpenMeteoProvider(WeatherProvider):
         }
 
     def get_current_weather(self, lat: float, lon: float) -> Dict[str, Any]:
-        """Get current weather using Open-Meteo current weather API."""
-        url = "https://api.open-meteo.com/v1/forecast"
-        today_str = date.today().isoformat()
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "temperature_2m,weather_code",
-            "daily": "temperature_2m_max,temperature_2m_min",
-            "timezone": "auto",
-            "timeformat": "unixtime",
-            "start_date": today_str,
-            "end_date": today_str,
-        }
-
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        """Get current weather from the combined Open-Meteo response."""
+        data = self._fetch_combined(lat, lon)
 
         current_temp = data["current"]["temperature_2m"]
         current_code = data["current"]["weather_code"]
@@ -140,39 +204,11 @@ class OpenMeteoProvider(WeatherProvider):
 
     def _weather_code_to_description(self, code: int) -> str:
         """Convert Open-Meteo weather code to description."""
-        # WMO Weather interpretation codes
-        code_map = {
-            0: "clear sky",
-            1: "mainly clear",
-            2: "partly cloudy",
-            3: "overcast",
-            45: "fog",
-            48: "depositing rime fog",
-            51: "light drizzle",
-            53: "moderate drizzle",
-            55: "dense drizzle",
-            56: "light freezing drizzle",
-            57: "dense freezing drizzle",
-            61: "slight rain",
-            63: "moderate rain",
-            65: "heavy rain",
-            66: "light freezing rain",
-            67: "heavy freezing rain",
-            71: "slight snow fall",
-            73: "moderate snow fall",
-            75: "heavy snow fall",
-            77: "snow grains",
-            80: "slight rain showers",
-            81: "moderate rain showers",
-            82: "violent rain showers",
-            85: "slight snow showers",
-            86: "heavy snow showers",
-            95: "thunderstorm",
-            96: "thunderstorm with slight hail",
-            99: "thunderstorm with heavy hail",
-        }
-
-        return code_map.get(code, f"unknown weather code {code}")
+        if 0 <= code < 100:
+            description = _WMO_DESC_TABLE[code]
+            if description:
+                return description
+        return f"unknown weather code {code}"
 
     def get_daily_summary(self, lat: float, lon: float) -> Dict[str, Any]:
         """Return today's actual max/min, current conditions, and tomorrow's forecast (max/min + description).
@@ -181,19 +217,7 @@ class OpenMeteoProvider(WeatherProvider):
             today_max, today_min, current_temp, current_description,
             tomorrow_max, tomorrow_min, tomorrow_description
         """
-        url = "https://api.open-meteo.com/v1/forecast"
-        # Request two days of daily data plus current
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "temperature_2m,weather_code",
-            "daily": "temperature_2m_max,temperature_2m_min,weather_code",
-            "timezone": "auto",
-            "forecast_days": 2,
-        }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = self._fetch_combined(lat, lon)
 
         current_temp = data["current"]["temperature_2m"]
         current_code = data["current"]["weather_code"]
@@ -219,3 +243,21 @@ class OpenMeteoProvider(WeatherProvider):
             "tomorrow_min": round(tomorrow_min, 1),
             "tomorrow_description": self._weather_code_to_description(tomorrow_code),
         }
+
+    def get_many_daily_summaries(self, cities: List[str]) -> List[Dict[str, Any]]:
+        """Fetch daily summaries for several cities with overlapped I/O.
+
+        Each city costs a geocoding call plus a forecast call; running
+        them on a small thread pool overlaps the network waits instead of
+        serializing them, while the pool size keeps us inside the API's
+        rate limits. Results are returned in input order.
+        """
+
+        def one(city: str) -> Dict[str, Any]:
+            lat, lon = self.get_coordinates(city)
+            return self.get_daily_summary(lat, lon)
+
+        if not cities:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(cities))) as pool:
+            return list(pool.map(one, cities))
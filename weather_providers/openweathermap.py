@@ -1,85 +1,175 @@
-import requests
+import time
+
 from datetime import datetime, timezone
 from typing import Dict, Tuple, Any
-from .base import WeatherProvider
+from .base import WeatherProvider, _loads, _dumps, _REQUEST_TIMEOUT
 
 
 class OpenWeatherMapProvider(WeatherProvider):
     """OpenWeatherMap weather provider implementation."""
 
+    # Conditional-GET cache for /forecast: OWM only refreshes forecast data
+    # every few hours, so most runs can revalidate with an ETag and get a
+    # bodyless 304 instead of redownloading unchanged JSON
+    _forecast_http_cache_path = "forecast_http_cache.json"
+    _forecast_http_cache_max_age = 6 * 3600
+
+    # OWM refreshes current-weather observations roughly every 10 minutes,
+    # so repeat asks within a minute can safely reuse the last response
+    _current_ttl = 60
+
     def __init__(self, api_key: str):
         super().__init__(api_key)
         if not api_key:
             raise ValueError("OpenWeatherMap API key is required")
+        # Coordinates never change for a city, so memoize lookups in-process
+        self._coords_cache = {}
+        # Current-weather responses keyed by rounded (lat, lon),
+        # as key -> (fetched_at, data)
+        self._current_cache = {}
+
+    def _load_forecast_http_cache(self, key: str):
+        """Load the cached /forecast response for this location, or None"""
+        try:
+            with open(self._forecast_http_cache_path, "rb") as f:
+                return _loads(f.read()).get(key)
+        except (OSError, ValueError):
+            # Missing or corrupt cache just means a full fetch
+            return None
+
+    def _save_forecast_http_cache(self, key: str, entry: Dict[str, Any]):
+        """Persist the /forecast response + validators for this location"""
+        try:
+            cache = {}
+            try:
+                with open(self._forecast_http_cache_path, "rb") as f:
+                    cache = _loads(f.read())
+            except (FileNotFoundError, ValueError):
+                pass  # start a fresh cache
+            cache[key] = entry
+            with open(self._forecast_http_cache_path, "wb") as f:
+                f.write(_dumps(cache))
+        except (OSError, TypeError):
+            pass
 
     def get_coordinates(self, city: str) -> Tuple[float, float]:
         """Get city coordinates using OpenWeatherMap Geocoding API."""
-        geo_url = "http://api.openweathermap.org/geo/1.0/direct"
-        params = {"q": city, "limit": 1, "appid": self.api_key}
+        key = city.strip().lower()
+        cached = self._coords_cache.get(key)
+        if cached is not None:
+            return cached
 
-        response = requests.get(geo_url, params=params)
-        response.raise_for_status()
+        geo_url = "https://api.openweathermap.org/geo/1.0/direct"
+        params = {"q": city, "limit": 1, "appid": self.api_key}
 
-        data = response.json()
+        data = self._get_json(geo_url, params)
         if not data:
             raise Exception(f"City '{city}' not found")
 
-        return data[0]["lat"], data[0]["lon"]
+        coords = (data[0]["lat"], data[0]["lon"])
+        self._coords_cache[key] = coords
+        return coords
 
     def get_today_forecast(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get today's forecast using OpenWeatherMap 5-day forecast API."""
         # Use 5-day forecast API to get today's detailed forecast
         url = "https://api.openweathermap.org/data/2.5/forecast"
-        params = {"lat": lat, "lon": lon, "appid": self.api_key, "units": "metric"}
+        params = {
+            "lat": lat,
+            "lon": lon,
+            "appid": self.api_key,
+            "units": "metric",
+            # Only today's slots are used; 8 x 3h covers the next 24 hours
+            # and shrinks the payload ~5x versus the full 5-day list
+            "cnt": 8,
+        }
 
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        cache_key = f"{round(lat, 4)},{round(lon, 4)}"
+        cached = self._load_forecast_http_cache(cache_key)
+        headers = {}
+        if cached and time.time() - cached.get("ts", 0) < self._forecast_http_cache_max_age:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self._session.get(
+            url, params=params, headers=headers, timeout=_REQUEST_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            # Not modified: reuse the cached body, skipping transfer + parse
+            # of a fresh payload
+            data = _loads(cached["body"])
+        else:
+            response.raise_for_status()
+            data = _loads(response.content)
+            if response.headers.get("ETag") or response.headers.get("Last-Modified"):
+                self._save_forecast_http_cache(
+                    cache_key,
+                    {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "body": response.text,
+                        "ts": time.time(),
+                    },
+                )
 
-        # Get today's forecasts only
-        today = datetime.now().date()
+        # Get today's forecasts only: compare raw epoch seconds against a
+        # precomputed [now, end-of-UTC-day) window instead of building a
+        # datetime per entry
         today_forecasts = []
+        max_temp = min_temp = None
 
         now = datetime.now(timezone.utc)
+        now_ts = int(now.timestamp())
+        day_end_ts = (
+            int(
+                datetime(
+                    now.year, now.month, now.day, tzinfo=timezone.utc
+                ).timestamp()
+            )
+            + 86400
+        )
         for forecast in data["list"]:
             # OpenWeatherMap dt is in UTC seconds
-            forecast_dt_utc = datetime.fromtimestamp(forecast["dt"], tz=timezone.utc)
+            dt = forecast["dt"]
             # Filter for same UTC date and times in the future relative to now
-            if forecast_dt_utc.date() == today and forecast_dt_utc >= now:
+            if now_ts <= dt < day_end_ts:
+                forecast_dt_utc = datetime.fromtimestamp(dt, tz=timezone.utc)
+                # Track max/min while filtering; avoids re-scanning the list
+                temp = forecast["main"]["temp"]
+                if max_temp is None or temp > max_temp:
+                    max_temp = temp
+                if min_temp is None or temp < min_temp:
+                    min_temp = temp
                 today_forecasts.append(
                     {
-                        "temp": forecast["main"]["temp"],
+                        "temp": temp,
                         "feels_like": forecast["main"]["feels_like"],
                         "temp_min": forecast["main"]["temp_min"],
                         "temp_max": forecast["main"]["temp_max"],
                         # Keep original hour string for backward compatibility but main usage will be via timestamp
                         "time": forecast_dt_utc.strftime("%H:%M"),
-                        "timestamp": forecast["dt"],  # UTC epoch seconds
+                        "timestamp": dt,  # UTC epoch seconds
                         "description": forecast["weather"][0]["description"],
                     }
                 )
 
         if not today_forecasts:
-            # Fallback to current weather if no future forecasts for today
-            current_data = self.get_current_weather(lat, lon)
+            # No future slots left today; the nearest forecast entry is an
+            # adequate "current" approximation and avoids a second request
+            f0 = data["list"][0]["main"]
             return {
-                "forecasted_max": round(
-                    current_data.get("temp_max", current_data["temp"]), 1
-                ),
-                "forecasted_min": round(
-                    current_data.get("temp_min", current_data["temp"]), 1
-                ),
-                "current_temp": round(current_data["temp"], 1),
-                "description": current_data["description"],
+                "forecasted_max": round(f0["temp_max"], 1),
+                "forecasted_min": round(f0["temp_min"], 1),
+                "current_temp": round(f0["temp"], 1),
+                "description": data["list"][0]["weather"][0]["description"],
                 "detailed_forecast": [],
             }
 
-        # Calculate max/min from remaining forecasts
-        temps = [f["temp"] for f in today_forecasts]
-
         return {
-            "forecasted_max": round(max(temps), 1),
-            "forecasted_min": round(min(temps), 1),
+            "forecasted_max": round(max_temp, 1),
+            "forecasted_min": round(min_temp, 1),
             "current_temp": round(today_forecasts[0]["temp"], 1),
             "description": today_forecasts[0]["description"],
             # Provide full list; selection (e.g., 3-hour intervals) handled at presentation layer.
@@ -88,16 +178,23 @@ class OpenWeatherMapProvider(WeatherProvider):
 
     def get_current_weather(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get current weather using OpenWeatherMap current weather API."""
+        key = (round(lat, 3), round(lon, 3))
+        cached = self._current_cache.get(key)
+        if cached is not None:
+            fetched_at, result = cached
+            if time.time() - fetched_at < self._current_ttl:
+                return result
+
         url = "https://api.openweathermap.org/data/2.5/weather"
         params = {"lat": lat, "lon": lon, "appid": self.api_key, "units": "metric"}
 
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json(url, params)
 
-        return {
+        result = {
             "temp": data["main"]["temp"],
             "temp_max": data["main"]["temp_max"],
             "temp_min": data["main"]["temp_min"],
             "description": data["weather"][0]["description"],
         }
+        self._current_cache[key] = (time.time(), result)
+        return result